@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Corpus de tableros Memorice pregenerados y memory-mapped.
+
+Escribe millones de tableros con semilla fija en un único archivo binario
+(cabecera fija + 1 byte o uint16 por carta) y los lee con `np.memmap`,
+entregando vistas sin copia al solver, repartidas por rangos de índices
+entre procesos. Así la generación de tableros y el estado del RNG quedan
+fuera de la medición y todos los solvers se comparan sobre los mismos
+tableros, en cualquier máquina.
+
+Uso:
+    python memorice_corpus.py write boards.bin --count 1000000 --seed 1234
+    python memorice_corpus.py eval boards.bin --workers 4
+"""
+import argparse
+import os
+import struct
+import time
+from multiprocessing import Pool
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from memorice_montecarlo import COLS, ROWS, check_config, print_report, random_boards, simulate, summarize
+
+# Cabecera (32 bytes, little-endian):
+# magic, versión, bytes por carta, ROWS, COLS, PAIRS, nº de tableros, semilla
+MAGIC = b"MEMC"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHHHQQ4x")
+
+CHUNK = 100_000  # tableros generados/escritos por bloque
+BLOCK = 10_000   # tableros por bloque de evaluación (unidad del RNG de la política)
+
+
+class CorpusHeader(NamedTuple):
+    itemsize: int
+    rows: int
+    cols: int
+    pairs: int
+    count: int
+    seed: int
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.uint8 if self.itemsize == 1 else "<u2")
+
+    @property
+    def cards(self) -> int:
+        return self.rows * self.cols
+
+
+def write_corpus(path: str, count: int, seed: int, rows: int = ROWS, cols: int = COLS,
+                 pairs: Optional[int] = None) -> CorpusHeader:
+    """Genera `count` tableros con semilla `seed` y los escribe en `path`."""
+    pairs = pairs if pairs is not None else (rows * cols) // 2
+    check_config(rows, cols, pairs)
+    if rows > 0xFFFF or cols > 0xFFFF or pairs > 0xFFFF:
+        raise ValueError(f"ROWS, COLS y PAIRS deben ser <= 65535 ({rows}x{cols}, PAIRS={pairs}).")
+    if not 0 <= seed < 2 ** 64:
+        raise ValueError(f"La semilla debe estar en [0, 2**64) (seed={seed}).")
+    if count < 0:
+        raise ValueError(f"El número de tableros debe ser >= 0 (count={count}).")
+    header = CorpusHeader(1 if pairs <= 256 else 2, rows, cols, pairs, count, seed)
+    raw = HEADER.pack(MAGIC, VERSION, *header)  # antes de abrir: no truncar `path` si falla
+
+    rng = np.random.default_rng(seed)
+    with open(path, "wb") as f:
+        f.write(raw)
+        left = count
+        while left > 0:
+            g = min(CHUNK, left)
+            f.write(random_boards(g, pairs, rng).astype(header.dtype).tobytes())
+            left -= g
+    return header
+
+
+def open_corpus(path: str) -> Tuple[CorpusHeader, np.memmap]:
+    """Lee la cabecera y mapea los tableros como arreglo (tableros × cartas) de solo lectura."""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path}: archivo demasiado corto para ser un corpus.")
+    magic, version, *fields = HEADER.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: no es un corpus Memorice v{VERSION}.")
+    header = CorpusHeader(*fields)
+    if header.itemsize not in (1, 2):
+        raise ValueError(f"{path}: tamaño de carta inválido ({header.itemsize} B).")
+    try:
+        check_config(header.rows, header.cols, header.pairs)
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from None
+    expected = HEADER.size + header.count * header.cards * header.itemsize
+    size = os.path.getsize(path)
+    if size != expected:
+        raise ValueError(f"{path}: tamaño {size} B, se esperaban {expected} B (¿archivo truncado?).")
+    boards = np.memmap(path, dtype=header.dtype, mode="r", offset=HEADER.size,
+                       shape=(header.count, header.cards))
+    return header, boards
+
+
+def shard_ranges(count: int, workers: int, align: int = 1) -> List[Tuple[int, int]]:
+    """Divide [0, count) en hasta `workers` rangos contiguos, con inicios múltiplos de `align`."""
+    blocks = -(-count // align)
+    per = -(-blocks // max(1, workers))
+    return [(s * align, min((s + per) * align, count)) for s in range(0, blocks, per)] if count else []
+
+
+def iter_boards(path: str, start: int = 0, stop: Optional[int] = None,
+                batch: int = CHUNK) -> Iterator[Tuple[int, np.ndarray]]:
+    """Entrega (índice, vista) con lotes de tableros del rango [start, stop), sin copiar."""
+    if batch < 1:
+        raise ValueError(f"El tamaño de lote debe ser >= 1 (batch={batch}).")
+    header, boards = open_corpus(path)
+    stop = header.count if stop is None else min(stop, header.count)
+    for i in range(start, stop, batch):
+        yield i, boards[i:min(i + batch, stop)]
+
+
+def _eval_shard(args: Tuple[str, int, int, int]) -> np.ndarray:
+    """Resuelve un rango del corpus y devuelve su histograma de movimientos."""
+    path, start, stop, seed = args
+    hist = np.zeros(0, dtype=np.int64)
+    for i, boards in iter_boards(path, start, stop, BLOCK):
+        # RNG de la política por bloque fijo de BLOCK tableros (índice global):
+        # igual resultado con cualquier nº de workers
+        counts = np.bincount(simulate(boards, np.random.default_rng([seed, i])))
+        if counts.size > hist.size:
+            hist = np.pad(hist, (0, counts.size - hist.size))
+        hist[:counts.size] += counts
+    return hist
+
+
+def evaluate(path: str, workers: int = 1, seed: Optional[int] = None) -> dict:
+    """Evalúa la IA de memoria perfecta sobre todo el corpus, repartido entre `workers` procesos."""
+    if workers < 1:
+        raise ValueError(f"El número de workers debe ser >= 1 (workers={workers}).")
+    header, _ = open_corpus(path)
+    seed = header.seed if seed is None else seed
+    jobs = [(path, a, b, seed) for a, b in shard_ranges(header.count, workers, BLOCK)]
+
+    t0 = time.perf_counter()
+    if workers > 1:
+        with Pool(workers) as pool:
+            parts = pool.map(_eval_shard, jobs)
+    else:
+        parts = [_eval_shard(j) for j in jobs]
+    elapsed = time.perf_counter() - t0
+
+    hist = np.zeros(max((p.size for p in parts), default=0), dtype=np.int64)
+    for p in parts:
+        hist[:p.size] += p
+    return summarize(hist, elapsed)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    w = sub.add_parser("write", help="generar corpus de tableros")
+    w.add_argument("path")
+    w.add_argument("--count", type=int, default=1_000_000)
+    w.add_argument("--seed", type=int, default=1234)
+    w.add_argument("--rows", type=int, default=ROWS)
+    w.add_argument("--cols", type=int, default=COLS)
+    w.add_argument("--pairs", type=int, default=None, help="por defecto ROWS*COLS//2")
+
+    e = sub.add_parser("eval", help="resolver el corpus con la IA")
+    e.add_argument("path")
+    e.add_argument("--workers", type=int, default=1)
+    e.add_argument("--seed", type=int, default=None, help="semilla de la política (por defecto la del corpus)")
+    args = ap.parse_args()
+
+    if args.cmd == "write":
+        t0 = time.perf_counter()
+        h = write_corpus(args.path, args.count, args.seed, args.rows, args.cols, args.pairs)
+        elapsed = time.perf_counter() - t0
+        size = HEADER.size + h.count * h.cards * h.itemsize
+        print(f"Listo. {h.count} tableros {h.rows}x{h.cols} ({h.itemsize} B/carta, {size:,} B) "
+              f"en {elapsed:.2f} s -> {args.path}")
+    else:
+        print_report(evaluate(args.path, args.workers, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Simulador Monte Carlo vectorizado (NumPy) de la IA de memoria perfecta.
+
+Reproduce la política de `Game._ia_pick_two` (memorice_frutas_fast.py) sobre
+un lote de tableros a la vez: cada tablero es una fila de enteros (id de
+símbolo) y el estado de cada partida son dos máscaras `seen`/`matched`.
+Cada iteración avanza un turno (1 movimiento) en todas las partidas activas.
+
+Uso:
+    python memorice_montecarlo.py --games 1000000 --seed 1234
+"""
+import argparse
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+# =====================
+# Configuración (igual a memorice_frutas_fast.py)
+# =====================
+ROWS, COLS = 6, 6
+PAIRS = (ROWS * COLS) // 2
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+def check_config(rows: int, cols: int, pairs: int) -> int:
+    """Valida ROWS/COLS/PAIRS y devuelve el número de cartas."""
+    if rows < 1 or cols < 1:
+        raise ValueError(f"ROWS y COLS deben ser >= 1 ({rows}x{cols}).")
+    n = rows * cols
+    if pairs < 1 or 2 * pairs != n:
+        raise ValueError(f"Se requieren exactamente {n // 2} pares para {rows}x{cols} (PAIRS={pairs}).")
+    return n
+
+
+def random_boards(games: int, pairs: int, rng: np.random.Generator) -> np.ndarray:
+    """Crea `games` tableros barajados (fila = tablero aplanado, valor = id de símbolo)."""
+    pool = np.tile(np.arange(pairs, dtype=np.min_scalar_type(pairs - 1)), 2)
+    perm = np.argsort(rng.random((games, 2 * pairs)), axis=1)
+    return pool[perm]
+
+
+def partners(boards: np.ndarray) -> np.ndarray:
+    """Para cada carta, índice de la otra carta con el mismo símbolo."""
+    order = np.argsort(boards, axis=1, kind="stable")
+    first, second = order[:, 0::2], order[:, 1::2]
+    part = np.empty_like(order)
+    np.put_along_axis(part, first, second, axis=1)
+    np.put_along_axis(part, second, first, axis=1)
+    return part
+
+
+def simulate(boards: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Resuelve todos los tableros con la política de memoria perfecta.
+
+    Devuelve un arreglo con los movimientos de cada partida (mismo orden que `boards`).
+    """
+    boards = np.asarray(boards)
+    games, n = boards.shape
+    moves = np.zeros(games, dtype=np.int32)
+
+    # Estado de las partidas activas (se compacta cuando alguna termina)
+    ids = np.arange(games)
+    part = partners(boards)
+    seen = np.zeros((games, n), dtype=bool)
+    matched = np.zeros((games, n), dtype=bool)
+    turns = 0
+
+    while ids.size:
+        turns += 1
+        rows = np.arange(ids.size)
+
+        # 1) Par conocido: ambas cartas vistas y sin emparejar
+        known = seen & np.take_along_axis(seen, part, axis=1) & ~matched
+        has_known = known.any(axis=1)
+        k = known.argmax(axis=1)
+
+        # 2) Explorar: `a` al azar entre las ocultas; `b` = pareja conocida de `a`
+        #    o, si no, otra oculta al azar (argmax de claves uniformes = elección uniforme)
+        keys = rng.random(seen.shape)
+        keys[matched] = -1.0
+        a = keys.argmax(axis=1)
+        pa = part[rows, a]
+        keys[rows, a] = -1.0
+        b = np.where(seen[rows, pa], pa, keys.argmax(axis=1))
+
+        a = np.where(has_known, k, a)
+        b = np.where(has_known, part[rows, k], b)
+
+        # Revelar y comprobar
+        seen[rows, a] = True
+        seen[rows, b] = True
+        hit = part[rows, a] == b
+        matched[rows[hit], a[hit]] = True
+        matched[rows[hit], b[hit]] = True
+
+        done = matched.all(axis=1)
+        if done.any():
+            moves[ids[done]] = turns
+            keep = ~done
+            ids, part, seen, matched = ids[keep], part[keep], seen[keep], matched[keep]
+
+    return moves
+
+
+def run(games: int, rows: int = ROWS, cols: int = COLS, pairs: Optional[int] = None,
+        seed: Optional[int] = None, batch: int = 100_000) -> Dict[str, object]:
+    """Simula `games` partidas en lotes de `batch` y devuelve métricas agregadas."""
+    pairs = pairs if pairs is not None else (rows * cols) // 2
+    check_config(rows, cols, pairs)
+    if games < 0:
+        raise ValueError(f"El número de partidas debe ser >= 0 (games={games}).")
+    if batch < 1:
+        raise ValueError(f"El tamaño de lote debe ser >= 1 (batch={batch}).")
+    rng = np.random.default_rng(seed)
+    hist = np.zeros(0, dtype=np.int64)
+
+    t0 = time.perf_counter()
+    left = games
+    while left > 0:
+        g = min(batch, left)
+        moves = simulate(random_boards(g, pairs, rng), rng)
+        counts = np.bincount(moves)
+        if counts.size > hist.size:
+            hist = np.pad(hist, (0, counts.size - hist.size))
+        hist[:counts.size] += counts
+        left -= g
+    elapsed = time.perf_counter() - t0
+
+    return summarize(hist, elapsed)
+
+
+def summarize(hist: np.ndarray, elapsed: float) -> Dict[str, object]:
+    """Métricas a partir del histograma de movimientos (índice = movimientos)."""
+    total = int(hist.sum())
+    values = np.arange(hist.size)
+    cdf = np.cumsum(hist)
+    mean = float((values * hist).sum() / total) if total else 0.0
+    std = float(np.sqrt(((values - mean) ** 2 * hist).sum() / total)) if total else 0.0
+    pct = {p: int(np.searchsorted(cdf, total * p / 100.0)) for p in PERCENTILES} if total else {}
+    nz = np.flatnonzero(hist)
+    return {
+        "games": total,
+        "hist": hist,
+        "mean": mean,
+        "std": std,
+        "min": int(nz[0]) if nz.size else 0,
+        "max": int(nz[-1]) if nz.size else 0,
+        "percentiles": pct,
+        "time_s": elapsed,
+        "games_per_s": total / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_report(res: Dict[str, object], width: int = 50) -> None:
+    """Imprime histograma de texto, percentiles y throughput."""
+    hist = res["hist"]
+    peak = hist.max() if hist.size else 0
+    print("Movimientos | Partidas")
+    for m in np.flatnonzero(hist):
+        bar = "#" * max(1, int(width * hist[m] / peak))
+        print(f"{m:11d} | {hist[m]:>10d} {bar}")
+    print()
+    print(f"Partidas: {res['games']} | media: {res['mean']:.3f} | desv.: {res['std']:.3f} "
+          f"| min: {res['min']} | max: {res['max']}")
+    print("Percentiles: " + ", ".join(f"p{p}={v}" for p, v in res["percentiles"].items()))
+    print(f"Tiempo: {res['time_s']:.2f} s | {res['games_per_s']:,.0f} partidas/s")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--games", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--rows", type=int, default=ROWS)
+    ap.add_argument("--cols", type=int, default=COLS)
+    ap.add_argument("--pairs", type=int, default=None, help="por defecto ROWS*COLS//2")
+    ap.add_argument("--batch", type=int, default=100_000, help="partidas simuladas por lote")
+    ap.add_argument("--csv", default=None, help="guardar histograma (moves,games)")
+    args = ap.parse_args()
+
+    res = run(args.games, args.rows, args.cols, args.pairs, args.seed, args.batch)
+    print_report(res)
+
+    if args.csv:
+        with open(args.csv, "w", encoding="utf-8") as f:
+            f.write("moves,games\n")
+            for m in np.flatnonzero(res["hist"]):
+                f.write(f"{m},{res['hist'][m]}\n")
+
+
+if __name__ == "__main__":
+    main()